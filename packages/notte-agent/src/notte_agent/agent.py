@@ -72,6 +72,11 @@ class NotteAgent(BaseAgent):
             llm=self.llm, perception=self.perception, use_vision=self.config.use_vision
         )
         self.has_run: bool = False
+        # get_messages re-renders every past trajectory step on each LLM call, which is
+        # O(steps^2) over a run; completed steps are immutable so their rendering is cached.
+        # Keeping the step in the value pins its id() for the lifetime of the cache entry.
+        self._step_message_cache: dict[int, tuple[AgentCompletion, str]] = {}
+        self._result_message_cache: dict[int, tuple[ExecutionResult, str]] = {}
 
         # ####################################
         # ########### Vault Setup ############
@@ -323,14 +328,21 @@ class NotteAgent(BaseAgent):
                 case AgentCompletion():
                     # TODO: choose if we want this to be an assistant message or a tool message
                     # self.conv.add_tool_message(step.agent_response, tool_id="step")
-                    conv.add_assistant_message(
-                        step.model_dump_json(exclude_none=True, context=dict(hide_interactions=True))
-                    )
+                    cached = self._step_message_cache.get(id(step))
+                    if cached is None or cached[0] is not step:
+                        cached = (step, step.model_dump_json(exclude_none=True, context=dict(hide_interactions=True)))
+                        self._step_message_cache[id(step)] = cached
+                    conv.add_assistant_message(cached[1])
                 case ExecutionResult():
                     # add step execution status to the conversation
-                    conv.add_user_message(
-                        content=self.perception.perceive_action_result(step, include_ids=False, include_data=True)
-                    )
+                    cached_result = self._result_message_cache.get(id(step))
+                    if cached_result is None or cached_result[0] is not step:
+                        cached_result = (
+                            step,
+                            self.perception.perceive_action_result(step, include_ids=False, include_data=True),
+                        )
+                        self._result_message_cache[id(step)] = cached_result
+                    conv.add_user_message(content=cached_result[1])
 
                 # observation or screenshot
                 case _:
@@ -79,32 +79,43 @@ class Conversation(BaseModel):
         """Get total tokens in conversation history"""
         return self._total_tokens
 
-    def trim_history_to_fit(self, new_content: AllMessageValues) -> None:
+    def trim_history_to_fit(self, new_content: AllMessageValues, new_content_tokens: int | None = None) -> None:
         """Trim history to make room for new content while preserving system messages"""
         if not self.autosize:
             return
 
+        if new_content_tokens is None:
+            new_content_tokens = self.count_tokens(new_content)
+
+        # Fast path: the running total already accounts for the whole history,
+        # so when everything fits there is nothing to partition or trim.
+        if self._total_tokens + new_content_tokens <= self.conservative_max_tokens:
+            return
+
         # Always keep system messages
+        # Single pass: partition and accumulate both token sums at the same time
         init_messages: list[CachedMessage] = []
         other_messages: list[CachedMessage] = []
+        init_tokens = 0
+        current_tokens = 0
         is_init_msg = True
         for msg in self.history:
             match is_init_msg, msg.message["role"]:
                 case True, "system":
                     init_messages.append(msg)
+                    init_tokens += msg.token_count
                 case True, "user":
                     # keep first user message as init message (need task description)
                     is_init_msg = False
                     init_messages.append(msg)
+                    init_tokens += msg.token_count
                 case _, _:
                     other_messages.append(msg)
+                    current_tokens += msg.token_count
 
-        new_content_tokens = self.count_tokens(new_content)
-        init_tokens = sum(msg.token_count for msg in init_messages)
         available_tokens = self.conservative_max_tokens - init_tokens - new_content_tokens
 
         # Remove oldest non-system messages until we have room
-        current_tokens = sum(msg.token_count for msg in other_messages)
         has_trimmed = 0
         while other_messages and current_tokens > available_tokens:
             removed = other_messages.pop(0)
@@ -117,13 +128,13 @@ class Conversation(BaseModel):
             )
 
         self.history = init_messages + other_messages
-        self._total_tokens = sum(msg.token_count for msg in self.history)
+        self._total_tokens = init_tokens + current_tokens
 
     def _add_message(self, msg: AllMessageValues) -> None:
         """Internal helper to add a message with token counting"""
         token_count = self.count_tokens(msg)
         if self.autosize:
-            self.trim_history_to_fit(msg)
+            self.trim_history_to_fit(msg, new_content_tokens=token_count)
         cached_msg = CachedMessage(message=msg, token_count=token_count)
         self.history.append(cached_msg)
         self._total_tokens += token_count
@@ -1,5 +1,6 @@
 import datetime as dt
 import json
+from functools import cached_property
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
@@ -36,8 +37,10 @@ class AgentResponse(BaseModel):
         return (self.closed_at - self.created_at).total_seconds()
 
     @computed_field
-    @property
+    @cached_property
     def steps(self) -> list[AgentCompletion]:
+        # cached: the trajectory is final once the response exists, and this
+        # walk is re-triggered by every model_dump and user access otherwise
         return list(self.trajectory.agent_completions())
 
     @override
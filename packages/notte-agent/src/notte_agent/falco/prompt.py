@@ -92,6 +92,7 @@ class FalcoPrompt(BasePrompt):
         self.max_actions_per_step: int = 1
         self.tools: list[BaseTool] = tools or []
         self.action_registry: ActionRegistry = ActionRegistry(tools)
+        self._rendered_system: str | None = None
 
     def example_form_filling(self) -> str:
         form_values: dict[Literal["address1", "city", "state"], str] = {
@@ -145,7 +146,12 @@ class FalcoPrompt(BasePrompt):
 
     @override
     def system(self) -> str:
-        return (
+        # system() is called on every agent step but everything it renders
+        # (template, action schemas, tool instructions) is fixed at construction,
+        # so the rendered prompt is built once and reused.
+        if self._rendered_system is not None:
+            return self._rendered_system
+        self._rendered_system = (
             chevron.render(
                 self.system_prompt,
                 {
@@ -163,6 +169,7 @@ class FalcoPrompt(BasePrompt):
             )
             + self.system_tools()
         )
+        return self._rendered_system
 
     def system_tools(self) -> str:
         if len(self.tools) == 0:
@@ -34,20 +34,28 @@ class PlaywrightManager(BaseModel, BaseWindowManager):
     BROWSER_OPERATION_TIMEOUT_SECONDS: ClassVar[int] = 30
     verbose: bool = False
     _playwright: Playwright | None = PrivateAttr(default=None)
+    # Serializes the lazy driver start/stop: concurrent astart() calls would
+    # otherwise both launch a driver and leak the one that loses the assignment race
+    _start_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+    # Windows currently open on this manager; the driver is stopped when the
+    # last one closes so it never outlives the event loop it is bound to
+    _open_windows: int = PrivateAttr(default=0)
 
     @override
     async def astart(self) -> None:
         """Initialize the playwright instance"""
         async with profiler.profile("start_playwright"):
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
+            async with self._start_lock:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
 
     @override
     async def astop(self) -> None:
         """Stop the playwright instance"""
-        if self._playwright is not None:
-            await self._playwright.stop()
-            self._playwright = None
+        async with self._start_lock:
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
 
     def is_started(self) -> bool:
         return self._playwright is not None
@@ -164,14 +172,21 @@ class PlaywrightManager(BaseModel, BaseWindowManager):
         options = options or BrowserWindowOptions.from_request(SessionStartRequest())
         browser = await self.create_playwright_browser(options)
         resource = await self.get_browser_resource(options, browser)
+        self._open_windows += 1
 
         async def on_close() -> None:
             try:
                 async with asyncio.timeout(self.BROWSER_OPERATION_TIMEOUT_SECONDS):
                     await browser.close()
-                    await self.astop()
             except Exception as e:
                 logger.error(f"Failed to close window: {e}")
+            finally:
+                # Keep the driver warm while other windows on this loop still use
+                # it (starting it is the expensive part of session creation), but
+                # stop it with the last window so it does not outlive its loop.
+                self._open_windows -= 1
+                if self._open_windows <= 0:
+                    await self.astop()
 
         return BrowserWindow(
             resource=resource,
@@ -57,7 +57,7 @@ class InteractionOnlyDomNodeRenderingPipe:
         max_len_per_attribute: int | None,
         is_parent_interaction: bool = False,
     ) -> list[str]:
-        if node.type.value == NodeType.TEXT.value:
+        if node.type is NodeType.TEXT:
             if len(node.children) > 0:
                 raise InvalidInternalCheckError(
                     check="Text node should not have children",
@@ -4,7 +4,7 @@ from notte_core.common.logging import logger
 
 
 def prune_empty_texts(node: DomNode) -> bool:
-    if node.type.value == NodeType.TEXT.value:
+    if node.type is NodeType.TEXT:
         if node.text.strip() == "":
             return False
     return True
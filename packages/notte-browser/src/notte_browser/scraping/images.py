@@ -2,6 +2,7 @@ from bs4 import BeautifulSoup, Tag
 from notte_core.common.logging import logger
 from notte_core.data.space import ImageCategory, ImageData
 from notte_core.utils.image import construct_image_url
+from notte_core.utils.url import clean_url
 
 from notte_browser.playwright_async_api import Locator
 from notte_browser.window import BrowserWindow
@@ -196,8 +197,6 @@ class ImageScrapingPipe:
             html_content: The raw HTML content to parse
             base_url: The base URL for constructing absolute image URLs
         """
-        from notte_core.utils.url import clean_url
-
         soup = BeautifulSoup(html_content, "html.parser")
 
         # Find all img, svg, and figure elements
@@ -30,11 +30,15 @@ class MarkdownPruningPipe:
     """
 
     # TODO: think about using markdown-it to handle nested images
+    # Patterns are compiled once at class definition: masking/unmasking runs on
+    # every scrape and per-call re.sub with a raw string pays a cache lookup each time.
     # First handle images - using non-greedy match for content between parentheses
-    image_pattern: ClassVar[str] = r"!\[([^\]]*)\]\s*\(([^)]*?)\)"
+    image_pattern: ClassVar[re.Pattern[str]] = re.compile(r"!\[([^\]]*)\]\s*\(([^)]*?)\)")
 
     # Then handle links - using a pattern that can contain nested images
-    link_pattern: ClassVar[str] = r"\[((?:[^\[\]]|\[(?:[^\[\]]|\[[^\[\]]*\])*\])*)\]\s*\(([^)]*?)\)"
+    link_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        r"\[((?:[^\[\]]|\[(?:[^\[\]]|\[[^\[\]]*\])*\])*)\]\s*\(([^)]*?)\)"
+    )
 
     @staticmethod
     def image_mask(match: re.Match[str], images: dict[str, str]) -> str:
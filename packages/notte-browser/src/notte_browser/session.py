@@ -110,6 +110,27 @@ from notte_browser.window import BrowserWindow, BrowserWindowOptions
 
 enable_nest_asyncio()
 
+# One manager per event loop: the Playwright driver transport is bound to the
+# loop it was started on, so sessions running on different loops (e.g. per-test
+# loops) must not share one. Sessions on the same loop share a warm driver; the
+# manager stops it once its last window closes (see PlaywrightManager.new_window).
+_playwright_managers: dict[asyncio.AbstractEventLoop, PlaywrightManager] = {}
+
+
+def _playwright_manager() -> PlaywrightManager:
+    loop = asyncio.get_running_loop()
+    for stale_loop in [cached for cached in _playwright_managers if cached.is_closed()]:
+        del _playwright_managers[stale_loop]
+    manager = _playwright_managers.get(loop)
+    if manager is None:
+        manager = _playwright_managers[loop] = PlaywrightManager()
+    return manager
+
+
+# Compiled once: matched against every EvaluateJsAction payload
+_JS_FUNCTION_RE = re.compile(r"^(?:\(|function\b|async\s+(?:function\b|\())")
+_JS_RETURN_RE = re.compile(r"\breturn\b")
+
 
 # TODO: ACT callback
 class NotteSession(AsyncResource, SyncResource):
@@ -206,9 +227,8 @@ class NotteSession(AsyncResource, SyncResource):
     async def astart(self) -> None:
         if self._window is not None:
             return
-        manager = PlaywrightManager()
         options = BrowserWindowOptions.from_request(self._request)
-        self._window = await manager.new_window(options)
+        self._window = await _playwright_manager().new_window(options)
         if self._cookie_file is not None:
             if Path(self._cookie_file).exists():
                 logger.info(f"🍪 Automatically loading cookies from {self._cookie_file}")
@@ -283,11 +303,14 @@ class NotteSession(AsyncResource, SyncResource):
         screenshot_type = screenshot_type or self.screenshot_type
 
         screenshots_traj = list(self.trajectory.all_screenshots())
-        screenshots: list[bytes] = [screen.bytes(screenshot_type) for screen in screenshots_traj]
-        if len(screenshots) == 0:
+        if len(screenshots_traj) == 0:
             raise ValueError("No screenshots found in agent trajectory")
-        elif len(screenshots) > 1 and screenshots[0] == Observation.empty().screenshot.bytes(screenshot_type):
-            screenshots = screenshots[1:]
+        if len(screenshots_traj) > 1 and screenshots_traj[0].bytes(
+            screenshot_type
+        ) == Observation.empty().screenshot.bytes(screenshot_type):
+            screenshots_traj = screenshots_traj[1:]
+        # stream raw bytes one frame at a time instead of holding the full list in memory
+        screenshots = (screen.bytes(screenshot_type) for screen in screenshots_traj)
         return ScreenshotReplay.from_bytes(screenshots).get(quality=90)  # pyright: ignore [reportArgumentType]
 
     # ---------------------------- observe, step functions ----------------------------
@@ -742,8 +765,8 @@ class NotteSession(AsyncResource, SyncResource):
                         #   "("            -> grouped expression / IIFE
                         #   "function ..." -> function declaration/expression (word boundary avoids "functionName()")
                         #   "async function" / "async (" -> async variants (avoids "asyncio.run()", "async_helper()")
-                        is_already_function = bool(re.match(r"^(?:\(|function\b|async\s+(?:function\b|\())", stripped))
-                        needs_wrap = bool(re.search(r"\breturn\b", stripped)) and not is_already_function
+                        is_already_function = bool(_JS_FUNCTION_RE.match(stripped))
+                        needs_wrap = bool(_JS_RETURN_RE.search(stripped)) and not is_already_function
                         js_code = f"(() => {{\n{code}\n}})()" if needs_wrap else code
                         try:
                             evaluate_kwargs: dict[str, bool] = {}
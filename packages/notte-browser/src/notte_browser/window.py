@@ -238,9 +238,14 @@ class BrowserWindow(BaseModel):
         if self.on_close is not None:
             await self.on_close()
         await self._close_all_cdp_sessions()
-        for page in self.resource.page.context.pages:
-            if not page.is_closed():
-                await page.close()
+        # close remaining tabs concurrently: total teardown latency is the
+        # slowest close instead of the sum over all open tabs
+        open_pages = [page for page in self.resource.page.context.pages if not page.is_closed()]
+        if open_pages:
+            results = await asyncio.gather(*(page.close() for page in open_pages), return_exceptions=True)
+            for page, result in zip(open_pages, results):
+                if isinstance(result, BaseException):
+                    logger.debug(f"Failed to close page {page.url}: {result}")
 
     @page.setter
     def page(self, page: Page) -> None:
@@ -315,12 +320,17 @@ class BrowserWindow(BaseModel):
     async def _close_all_cdp_sessions(self) -> None:
         sessions = list(self._cdp_sessions.values())
         self._cdp_sessions.clear()
-        for session in sessions:
+
+        async def detach_one(session: CDPSession) -> None:
             try:
                 _ = await asyncio.wait_for(session.detach(), timeout=2.0)
             except Exception as e:  # noqa: BLE001 - best-effort cleanup on shutdown
                 logger.debug(f"CDP session detach failed during close: {type(e).__name__}: {e}")
 
+        if sessions:
+            # detach concurrently so the 2s timeout bounds the whole cleanup, not each session
+            _ = await asyncio.gather(*(detach_one(session) for session in sessions))
+
     async def page_id(self, tab_idx: int | None = None) -> str:
         session = await self.get_cdp_session(tab_idx)
         target_id: Any = await session.send("Target.getTargetInfo")  # pyright: ignore [reportUnknownMemberType]
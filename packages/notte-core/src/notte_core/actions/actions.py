@@ -145,7 +145,8 @@ class BaseAction(BaseModel, metaclass=ABCMeta):
         return data
 
     def model_dump_agent_json(self) -> str:
-        return json.dumps(self.model_dump(exclude=self.non_agent_fields()))
+        # Serialize directly with pydantic-core instead of model_dump + json.dumps
+        return self.model_dump_json(exclude=self.non_agent_fields())
 
 
 class BrowserAction(BaseAction, metaclass=ABCMeta):
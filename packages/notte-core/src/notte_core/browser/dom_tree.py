@@ -458,14 +458,14 @@ class DomNode:
             return False
         if self.id is None:
             return False
-        if self.type.value == NodeType.INTERACTION.value:
+        if self.type is NodeType.INTERACTION:
             return True
-        return self.role.category().value in [NodeCategory.INTERACTION.value]
+        return self.role.category() is NodeCategory.INTERACTION
 
     def is_image(self) -> bool:
         if isinstance(self.role, str):
             return False
-        return self.role.category().value == NodeCategory.IMAGE.value
+        return self.role.category() is NodeCategory.IMAGE
 
     @classmethod
     def empty_root(cls) -> "DomNode":
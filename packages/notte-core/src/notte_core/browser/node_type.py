@@ -259,9 +259,10 @@ class NodeRole(Enum):
 
     @staticmethod
     def from_value(value: str) -> "NodeRole | str":
-        if value.upper() in NodeRole.__members__:
-            return NodeRole[value.upper()]
-        return value
+        # called once per DOM node: a single dict lookup instead of a
+        # membership test followed by a second lookup (and a second .upper())
+        role = NodeRole.__members__.get(value.upper())
+        return role if role is not None else value
 
     def short_id(self, force_id: bool = False) -> str | None:
         match self.value:
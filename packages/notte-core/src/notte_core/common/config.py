@@ -1,5 +1,7 @@
 import os
+import re
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, Required, Self, Unpack
 
@@ -130,6 +132,35 @@ class LlmProvider(StrEnum):
         return os.getenv(self.apikey_name) is not None
 
 
+# OpenRouter display names for providers that should be pinned when routing.
+# One compiled alternation scans the model string once instead of K substring probes.
+# Kept at module level: attributes defined on a StrEnum body would become members.
+_OPENROUTER_PROVIDER_NAMES: dict[str, str] = {
+    "cerebras": "Cerebras",
+    "groq": "Groq",
+    "together_ai": "Together",
+}
+_OPENROUTER_PROVIDER_RE: re.Pattern[str] = re.compile(r"^(?:openrouter/)?(cerebras|groq|together_ai)/")
+
+# Ordered rewrite rules for get_openrouter_model: the first matching pattern is
+# substituted and iteration stops. Model-specific rules (which collapse the whole
+# string to a canonical OpenRouter slug) come before the generic prefix renames.
+# All patterns are compiled at import time; adding a provider is a one-line edit.
+_OPENROUTER_MODEL_RULES: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"^.*/gpt-oss-120b.*$"), "openai/gpt-oss-120b"),
+    (re.compile(r"^.*/gemma-3-27b-it.*$"), "google/gemma-3-27b-it"),
+    (re.compile(r"^.*/deepseek-r1.*$"), "deepseek/deepseek-r1"),
+    (re.compile(r"^.*/claude-sonnet-4-5.*$"), "anthropic/claude-sonnet-4-5"),
+    (re.compile(r"^.*/kimi-k2\.5.*$"), "moonshotai/kimi-k2.5"),
+    (re.compile(r"^.*/llama-3\.3-70b-instruct.*$"), "meta-llama/llama-3.3-70b-instruct"),
+    (re.compile(r"^.*/grok-4-1-fast-non-reasoning.*$"), "x-ai/grok-4.1-fast"),
+    (re.compile(r"vertex_ai"), "google"),
+    (re.compile(r"gemini/"), "google/"),
+    (re.compile(r"xai/"), "x-ai/"),
+    (re.compile(r"zai/"), "z-ai/"),
+]
+
+
 class LlmModel(StrEnum):
     openai = "openai/gpt-4o"
     gemini = "gemini/gemini-2.5-flash"
@@ -159,53 +190,22 @@ class LlmModel(StrEnum):
 
     @staticmethod
     def get_openrouter_provider(model: str) -> str | None:
-        if "cerebras/" in model:
-            return "Cerebras"
-        if "groq/" in model:
-            return "Groq"
-        if "together_ai/" in model:
-            return "Together"
-        return None
+        match = _OPENROUTER_PROVIDER_RE.search(model)
+        if match is None:
+            return None
+        return _OPENROUTER_PROVIDER_NAMES[match.group(1)]
 
     @staticmethod
     def get_openrouter_model(model: str) -> str:
         if model.startswith("openrouter/"):
             return model
 
-        _model = model
-        if "/gpt-oss-120b" in _model:
-            _model = "openai/gpt-oss-120b"
-
-        if "/gemma-3-27b-it" in _model:
-            _model = "google/gemma-3-27b-it"
-
-        if "/deepseek-r1" in _model:
-            _model = "deepseek/deepseek-r1"
-
-        if "/claude-sonnet-4-5" in _model:
-            _model = "anthropic/claude-sonnet-4-5"
-
-        if "vertex_ai/" in _model:
-            _model = _model.replace("vertex_ai", "google")
-
-        if "gemini/" in _model:
-            _model = _model.replace("gemini/", "google/")
-
-        if "/kimi-k2.5" in _model:
-            _model = "moonshotai/kimi-k2.5"
+        for pattern, replacement in _OPENROUTER_MODEL_RULES:
+            if pattern.search(model) is not None:
+                model = pattern.sub(replacement, model, count=1)
+                break
 
-        if "/llama-3.3-70b-instruct" in _model:
-            _model = "meta-llama/llama-3.3-70b-instruct"
-
-        if "/grok-4-1-fast-non-reasoning" in _model:
-            _model = "x-ai/grok-4.1-fast"
-        elif "xai/" in _model:
-            _model = _model.replace("xai/", "x-ai/")
-
-        if "zai/" in _model:
-            _model = _model.replace("zai/", "z-ai/")
-
-        return f"openrouter/{_model}"
+        return f"openrouter/{model}"
 
     @property
     def context_length(self) -> int:
@@ -351,14 +351,24 @@ class NotteConfigDict(TypedDict, total=False):
     enable_profiling: bool
 
 
+@lru_cache(maxsize=4)
+def _load_toml_file(path: Path) -> dict[str, Any]:
+    """Read and parse a TOML config file once per process.
+
+    Configs are re-loaded on every agent/session creation; the files never
+    change at runtime so the parsed content can be safely reused.
+    """
+    with path.open("r") as f:
+        return toml.load(f)
+
+
 class TomlConfig(BaseModel):
     @classmethod
     def from_toml(cls, **data: Unpack[NotteConfigDict]) -> Self:
         """Load settings from a TOML file."""
 
         # load default config
-        with DEFAULT_CONFIG_PATH.open("r") as f:
-            toml_data = toml.load(f)
+        toml_data = _load_toml_file(DEFAULT_CONFIG_PATH)
 
         path = os.getenv("NOTTE_CONFIG_PATH")
 
@@ -367,11 +377,8 @@ class TomlConfig(BaseModel):
             if not path.exists():
                 raise FileNotFoundError(f"Config file not found: {path}")
 
-            # load external config
-            with path.open("r") as f:
-                external_toml_data = toml.load(f)
-
-            # merge configs
+            # load external config and merge
+            external_toml_data = _load_toml_file(path)
             toml_data = {**toml_data, **external_toml_data}
         toml_data = {**toml_data, **data}
 
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
 def text_contains_tabs(text: str) -> bool:
     """
     Determine if a given text has significant indentation patterns.
@@ -11,12 +15,9 @@ def text_contains_tabs(text: str) -> bool:
     if not text or text.isspace():
         return False
 
-    # Split into lines and remove empty lines
-    lines = [line for line in text.split("\n") if line.strip()]
-    if not lines:
-        return False
-
-    # Count lines with leading whitespace or tabs
-    indented_lines: int = sum(1 for line in lines if line.startswith((" ", "\t")))
+    # Fast path for single-line snippets: no split needed
+    if "\n" not in text:
+        return text.startswith((" ", "\t"))
 
-    return indented_lines >= 1
+    # Single pass over the lines: stop at the first non-blank indented line
+    return any(line.startswith((" ", "\t")) and line.strip() for line in text.split("\n"))
@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
-import aiohttp
 import requests
 from PIL import Image, ImageDraw, ImageFont
 
@@ -98,6 +97,9 @@ def get_images_as_files(image_urls: list[str]) -> list[Path | None]:
 
 async def get_images_as_base64(images_urls: list[str]) -> dict[str, Any]:
     """Returns images as base64 strings with metadata"""
+    # Lazy import: aiohttp is only needed here and is expensive to import
+    import aiohttp
+
     img_lst: list[dict[str, Any]] = []
 
     async with aiohttp.ClientSession() as session:
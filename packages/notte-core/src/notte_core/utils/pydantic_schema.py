@@ -1,6 +1,8 @@
 # Code taken from:
 import datetime as dt
+import json
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, ClassVar, Literal, Optional, Union, cast  # type: ignore[attr-defined]
 
 from pydantic import BaseModel, ConfigDict, Field, create_model, field_serializer, field_validator, model_validator
@@ -146,6 +148,14 @@ def create_model_from_schema(schema: dict[str, Any]) -> type[BaseModel]:
     return CustomModel
 
 
+@lru_cache(maxsize=64)
+def _create_model_from_schema_cached(schema_json: str) -> type[BaseModel]:
+    """Memoized wrapper: building a dynamic model is expensive (full pydantic
+    core-schema construction), and the same response format is typically
+    reused across many scrape calls."""
+    return create_model_from_schema(json.loads(schema_json))
+
+
 def convert_response_format_to_pydantic_model(value: dict[str, Any] | type[BaseModel] | None) -> type[BaseModel] | None:
     """
     Creates a Pydantic model from a given JSON Schema.
@@ -167,7 +177,12 @@ def convert_response_format_to_pydantic_model(value: dict[str, Any] | type[BaseM
         return None
 
     try:
-        return create_model_from_schema(value)
+        try:
+            schema_json = json.dumps(value, sort_keys=True)
+        except TypeError:
+            # Schema is not JSON-serializable (e.g. contains custom objects): build without caching
+            return create_model_from_schema(value)
+        return _create_model_from_schema_cached(schema_json)
     except Exception as e:
         raise InvalidResponseFormat from e
 
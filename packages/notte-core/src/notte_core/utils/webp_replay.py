@@ -4,13 +4,15 @@ import math
 import tempfile
 import textwrap
 from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, final
 
 from PIL import Image, ImageDraw
 from pydantic import BaseModel, model_validator
 
-from notte_core.utils.image import draw_text_with_rounded_background
+from notte_core.utils.image import draw_text_with_rounded_background, get_emoji_capable_font
 
 
 def extract_frame_from_webp(
@@ -181,8 +183,16 @@ class ScreenshotReplay(BaseModel):
             self._pillow_images = []
             return self
 
-        # Convert base64 to pillow images
-        images = [self.base64_to_pillow_image(screen) for screen in self.b64_screenshots]
+        # Convert base64 to pillow images, decoding each distinct frame only once:
+        # consecutive steps frequently capture identical screenshots (page unchanged
+        # while the agent is thinking), so duplicates are common in long replays.
+        decoded: dict[str, Image.Image] = {}
+        images: list[Image.Image] = []
+        for screen in self.b64_screenshots:
+            img = decoded.get(screen)
+            if img is None:
+                img = decoded[screen] = self.base64_to_pillow_image(screen)
+            images.append(img)
 
         if not images:
             self._pillow_images = []
@@ -192,13 +202,7 @@ class ScreenshotReplay(BaseModel):
         most_common_size = Counter(sizes).most_common(1)[0][0] if sizes else images[0].size
 
         # Standardize all images to the most common size
-        standardized_images: list[Image.Image] = []
-        for img in images:
-            if img.size != most_common_size:
-                img = img.resize(most_common_size)
-            standardized_images.append(img)
-
-        self._pillow_images = standardized_images
+        self._pillow_images = [img if img.size == most_common_size else img.resize(most_common_size) for img in images]
         return self
 
     @property
@@ -213,14 +217,21 @@ class ScreenshotReplay(BaseModel):
         return [base64.b64decode(screen) for screen in self.b64_screenshots]
 
     @classmethod
-    def from_bytes(cls, screenshots: list[bytes]):
+    def from_bytes(cls, screenshots: Iterable[bytes]):
+        # Accepts any iterable so callers can stream frames in one at a time
+        # instead of materializing the full list of raw PNG bytes first.
         as_base64 = [base64.b64encode(screen).decode() for screen in screenshots]
         return cls(b64_screenshots=as_base64)
 
     @staticmethod
     def base64_to_pillow_image(screenshot: str) -> Image.Image:
         image_data = base64.b64decode(screenshot)
-        return Image.open(io.BytesIO(image_data))
+        image = Image.open(io.BytesIO(image_data))
+        # Decode eagerly: deduplicated frames share one Image object, and PIL's
+        # lazy load() is not safe when the parallel resize in build_webp hits
+        # the same object from several threads at once
+        image.load()
+        return image
 
     def build_webp(
         self,
@@ -235,23 +246,20 @@ class ScreenshotReplay(BaseModel):
         if len(self.b64_screenshots) == 0:
             return b""
 
-        # resize images with scale factor
-        resized_screenshots: list[Image.Image] = []
-        prev_size = None
-
-        for im in self.pillow_images:
-            if prev_size is None:
-                prev_size = im.size
-            else:
-                # if next images are of incorrect size, either ignore or reshape them
-                if prev_size != im.size and ignore_incorrect_size:
-                    continue
-
-            (width, height) = (int(math.ceil(prev_size[0] * scale_factor)), int(math.ceil(prev_size[1] * scale_factor)))
-
-            resized_screenshots.append(im.resize((width, height)))
-
-        width, height = resized_screenshots[0].size
+        # resize images with scale factor; the first frame fixes the target size,
+        # frames of another size are either dropped or reshaped to it
+        first_size = self.pillow_images[0].size
+        frames = [
+            im
+            for i, im in enumerate(self.pillow_images)
+            if i == 0 or im.size == first_size or not ignore_incorrect_size
+        ]
+        (width, height) = (int(math.ceil(first_size[0] * scale_factor)), int(math.ceil(first_size[1] * scale_factor)))
+
+        # PIL releases the GIL while resampling, so resizing the frames is done in
+        # parallel — this is the CPU-heavy part of the replay build for long runs
+        with ThreadPoolExecutor() as executor:
+            resized_screenshots = list(executor.map(lambda im: im.resize((width, height)), frames))
 
         # fonts
         min_len = max(min(width, height), 25)
@@ -264,8 +272,6 @@ class ScreenshotReplay(BaseModel):
         draw = ImageDraw.Draw(start_image)
 
         # Use emoji-capable font for start text
-        from notte_core.utils.image import get_emoji_capable_font
-
         start_font = get_emoji_capable_font(medium_font_size)
 
         if start_text is not None:
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +18,17 @@ PROMPT_DIR = Path(__file__).parent / "prompts"
 LLAMUX_CONFIG = Path(__file__).parent / "config" / "endpoints.csv"
 
 
+@lru_cache(maxsize=2)
+def get_tokenizer(encoding_name: str = "cl100k_base") -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process.
+
+    Building an encoding reads the BPE ranks from disk and compiles the
+    tokenizer tables; sharing one instance across LLMService objects is safe
+    since tiktoken encodings are thread-safe.
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
 def get_llamux_config(verbose: bool = False) -> str:
     if "LLAMUX_CONFIG_PATH" in os.environ:
         if verbose:
@@ -43,7 +55,7 @@ class LLMService:
                 raise FileNotFoundError(f"LLAMUX config file not found at {path}")
             self.router = Router.from_csv(llamux_config)
         self.base_model: str = base_model or LlmModel.default()
-        self.tokenizer: tiktoken.Encoding = tiktoken.get_encoding("cl100k_base")
+        self.tokenizer: tiktoken.Encoding = get_tokenizer()
         self.verbose: bool = config.verbose
         self.nb_retries_structured_output: int = config.nb_retries_structured_output
 
@@ -70,8 +82,10 @@ class LLMService:
             router = "fixed"
             base_model = self.base_model
 
-        token_len = self.estimate_tokens(text="\n".join([m["content"] for m in messages]))
         if self.verbose:
+            # full-prompt tokenization is only worth paying for when the debug
+            # line is actually emitted
+            token_len = self.estimate_tokens(text="\n".join([m["content"] for m in messages]))
             logger.debug(f"llm router '{router}' selected '{base_model}' for approx {token_len} tokens")
         return base_model, eid
 
@@ -1,6 +1,7 @@
 import json
 import os
 import re
+import threading
 from abc import ABC
 from collections.abc import Sequence
 from json import JSONDecodeError
@@ -25,6 +26,40 @@ _cached_pypi_version: str | None = None
 _version_check_performed: bool = False
 
 
+class _ThreadLocalHTTPSession:
+    """Hands each thread its own requests.Session.
+
+    All clients talk to the same API host, so reusing a session keeps TCP/TLS
+    connections alive across endpoint calls. One session per thread (rather than
+    a single shared one) because requests.Session is not documented thread-safe
+    and the async client wrappers dispatch blocking calls via asyncio.to_thread.
+    """
+
+    def __init__(self) -> None:
+        self._local: threading.local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def get(self, **kwargs: Any) -> requests.Response:
+        return self._session().get(**kwargs)
+
+    def post(self, **kwargs: Any) -> requests.Response:
+        return self._session().post(**kwargs)
+
+    def patch(self, **kwargs: Any) -> requests.Response:
+        return self._session().patch(**kwargs)
+
+    def delete(self, **kwargs: Any) -> requests.Response:
+        return self._session().delete(**kwargs)
+
+
+_http_session = _ThreadLocalHTTPSession()
+
+
 class NotteEndpoint(BaseModel, Generic[TResponse]):
     path: str
     response: type[TResponse]
@@ -78,6 +113,10 @@ class NotteEndpoint(BaseModel, Generic[TResponse]):
 
 
 class BaseClient(ABC):
+    # Slots: clients are created per-session in high-churn workloads; avoid a
+    # per-instance __dict__ and speed up attribute access
+    __slots__ = ("root_client", "token", "server_url", "base_endpoint_path", "verbose", "_static_headers")
+
     DEFAULT_NOTTE_API_URL: ClassVar[str] = "https://api.notte.cc"
     DEFAULT_REQUEST_TIMEOUT_SECONDS: ClassVar[int] = 60
     DEFAULT_FILE_CHUNK_SIZE: ClassVar[int] = 8192
@@ -118,6 +157,12 @@ class BaseClient(ABC):
         self.server_url: str = server_url or os.getenv("NOTTE_API_URL") or self.DEFAULT_NOTTE_API_URL
         self.base_endpoint_path: str | None = base_endpoint_path
         self.verbose: bool = verbose
+        # Invariant for the lifetime of the client: build once instead of per request
+        self._static_headers: dict[str, str] = {
+            "Authorization": f"Bearer {self.token}",
+            "x-notte-sdk-version": notte_core_version,
+            "x-notte-request-origin": self.REQUEST_ORIGIN,
+        }
 
         # Check for version mismatch and warn user if needed
         self.check_and_warn_version_mismatch()
@@ -311,12 +356,9 @@ class BaseClient(ABC):
         which is formatted as a Bearer token using the API key stored in self.token.
         Also includes headers to identify the request as coming from the SDK.
         """
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "x-notte-sdk-version": notte_core_version,
-            "x-notte-request-origin": self.REQUEST_ORIGIN,
-            **(headers or {}),
-        }
+        if not headers:
+            return dict(self._static_headers)
+        return {**self._static_headers, **headers}
 
     def request_path(self, endpoint: NotteEndpoint[TResponse]) -> str:
         """
@@ -375,7 +417,7 @@ class BaseClient(ABC):
             logger.info(f"Making `{endpoint.method}` request to `{endpoint.path} (i.e `{url}`) with params `{params}`.")
         match endpoint.method:
             case "GET":
-                response = requests.get(
+                response = _http_session.get(
                     url=url,
                     headers=headers,
                     params=params,
@@ -392,7 +434,7 @@ class BaseClient(ABC):
                 else:
                     # if files is not None, data must not be a string
                     data = endpoint.request.model_dump(exclude_none=True)
-                method = requests.post if endpoint.method == "POST" else requests.patch
+                method = _http_session.post if endpoint.method == "POST" else _http_session.patch
                 response = method(
                     url=url,
                     headers=headers,
@@ -403,7 +445,7 @@ class BaseClient(ABC):
                     json=json,
                 )
             case "DELETE":
-                response = requests.delete(
+                response = _http_session.delete(
                     url=url,
                     headers=headers,
                     params=params,
@@ -527,7 +569,7 @@ class BaseClient(ABC):
         self, endpoint: NotteEndpoint[TResponse], file_type: str, output_file: str | None = None
     ) -> bytes:
         url = self.request_path(endpoint)
-        response = requests.get(
+        response = _http_session.get(
             url=url,
             headers=self.headers(),
             timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS,
@@ -549,7 +591,7 @@ class BaseClient(ABC):
         return response.content
 
     def request_download(self, url: str, file_path: str) -> bool:
-        with requests.get(
+        with _http_session.get(
             url=url,
             stream=True,
             timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS,
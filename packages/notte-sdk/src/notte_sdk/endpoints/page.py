@@ -205,8 +205,9 @@ class PageClient(BaseClient):
             # Use structured.get() which raises ScrapeFailedError if failed, and unwraps RootModel
             if raise_on_failure:
                 extracted_data = structured.get()
-                # Validate against response_format if provided
-                if request.response_format is not None:
+                # Validate against response_format if provided (skip the dump/validate
+                # round-trip when the data is already an instance of the expected model)
+                if request.response_format is not None and not isinstance(extracted_data, request.response_format):
                     extracted_data_dict = (
                         extracted_data.model_dump() if isinstance(extracted_data, BaseModel) else extracted_data  # pyright: ignore[reportUnnecessaryIsInstance]
                     )
@@ -217,7 +218,11 @@ class PageClient(BaseClient):
                 # unwrap RootModel
                 structured_data = cast(Any, structured_data.root)
                 structured.data = structured_data
-            if request.response_format is not None and structured_data is not None:
+            if (
+                request.response_format is not None
+                and structured_data is not None
+                and not isinstance(structured_data, request.response_format)
+            ):
                 structured.data = request.response_format.model_validate(structured_data)
             return structured
         return response.markdown
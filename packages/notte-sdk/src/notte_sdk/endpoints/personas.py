@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from functools import cached_property
+from functools import cache, cached_property
 from typing import TYPE_CHECKING, Unpack, overload
 
 from notte_core.common.logging import logger
@@ -81,7 +81,7 @@ class PersonasClient(BaseClient):
         and expects a sequence of EmailResponse.
         """
         return NotteEndpoint(
-            path=PersonasClient.LIST_EMAILS.format(persona_id=persona_id),
+            path=f"{persona_id}/emails",
             response=EmailResponse,
             method="GET",
         )
@@ -95,7 +95,7 @@ class PersonasClient(BaseClient):
         and expects a sequence of SMSResponse.
         """
         return NotteEndpoint(
-            path=PersonasClient.LIST_SMS.format(persona_id=persona_id),
+            path=f"{persona_id}/sms",
             response=SMSResponse,
             method="GET",
         )
@@ -108,7 +108,7 @@ class PersonasClient(BaseClient):
         The returned endpoint uses the create number path from PersonasClient with the POST method returns a CreatePhoneNumberResponse.
         """
         return NotteEndpoint(
-            path=PersonasClient.CREATE_NUMBER.format(persona_id=persona_id),
+            path=f"{persona_id}/sms/number",
             response=CreatePhoneNumberResponse,
             method="POST",
         )
@@ -119,12 +119,13 @@ class PersonasClient(BaseClient):
         Returns a NotteEndpoint configured for deleting a virtual phone number.
         """
         return NotteEndpoint(
-            path=PersonasClient.DELETE_NUMBER.format(persona_id=persona_id),
+            path=f"{persona_id}/sms/number",
             response=DeletePhoneNumberResponse,
             method="DELETE",
         )
 
     @staticmethod
+    @cache
     def _create_persona_endpoint() -> NotteEndpoint[PersonaResponse]:
         """
         Returns a NotteEndpoint configured for creating a persona.
@@ -143,7 +144,7 @@ class PersonasClient(BaseClient):
         Returns a NotteEndpoint configured for getting a persona.
         """
         return NotteEndpoint(
-            path=PersonasClient.GET_PERSONA.format(persona_id=persona_id),
+            path=persona_id,
             response=PersonaResponse,
             method="GET",
         )
@@ -151,12 +152,13 @@ class PersonasClient(BaseClient):
     @staticmethod
     def _delete_persona_endpoint(persona_id: str) -> NotteEndpoint[DeletePersonaResponse]:
         return NotteEndpoint(
-            path=PersonasClient.DELETE_PERSONA.format(persona_id=persona_id),
+            path=persona_id,
             response=DeletePersonaResponse,
             method="DELETE",
         )
 
     @staticmethod
+    @cache
     def _list_personas_endpoint() -> NotteEndpoint[PersonaResponse]:
         return NotteEndpoint(
             path=PersonasClient.LIST_PERSONAS,
@@ -1,6 +1,8 @@
+import asyncio
 import time
 from collections.abc import Sequence
 from enum import StrEnum
+from functools import cache, lru_cache
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Literal, Unpack, overload
@@ -130,6 +132,8 @@ class SessionsClient(BaseClient):
     If you need to handle multiple sessions, you need to create a new client for each session.
     """
 
+    __slots__ = ("page", "viewer_type")
+
     # Session
     SESSION_START = "start"
     SESSION_STOP = "{session_id}/stop"
@@ -173,15 +177,18 @@ class SessionsClient(BaseClient):
         self.viewer_type: SessionViewerType = viewer_type
 
     @staticmethod
+    @cache
     def _session_start_endpoint() -> NotteEndpoint[SessionResponse]:
         """
         Returns a NotteEndpoint configured for starting a session.
 
         The returned endpoint uses the session start path from SessionsClient with the POST method and expects a SessionResponse.
+        The endpoint is built once and memoized; callers attach per-request state via `with_request` (which copies).
         """
         return NotteEndpoint(path=SessionsClient.SESSION_START, response=SessionResponse, method="POST")
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_stop_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionResponse]:
         """
         Constructs a DELETE endpoint for closing a session.
@@ -195,12 +202,11 @@ class SessionsClient(BaseClient):
         Returns:
             A NotteEndpoint instance for closing a session.
         """
-        path = SessionsClient.SESSION_STOP
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_STOP if session_id is None else f"{session_id}/stop"
         return NotteEndpoint(path=path, response=SessionResponse, method="DELETE")
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_status_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionResponse]:
         """
         Returns a NotteEndpoint for retrieving the status of a session.
@@ -208,9 +214,7 @@ class SessionsClient(BaseClient):
         If a session_id is provided, it is interpolated into the endpoint path.
         The endpoint uses the GET method and expects a SessionResponse.
         """
-        path = SessionsClient.SESSION_STATUS
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_STATUS if session_id is None else f"{session_id}"
         return NotteEndpoint(path=path, response=SessionResponse, method="GET")
 
     @staticmethod
@@ -233,6 +237,7 @@ class SessionsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_debug_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionDebugResponse]:
         """
         Creates a NotteEndpoint for retrieving session debug information.
@@ -240,9 +245,7 @@ class SessionsClient(BaseClient):
         If a session ID is provided, it is interpolated into the endpoint path.
         The returned endpoint uses the GET method and expects a SessionDebugResponse.
         """
-        path = SessionsClient.SESSION_DEBUG
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_DEBUG if session_id is None else f"{session_id}/debug"
         return NotteEndpoint(path=path, response=SessionDebugResponse, method="GET")
 
     @staticmethod
@@ -258,9 +261,7 @@ class SessionsClient(BaseClient):
         Returns:
             NotteEndpoint[TabSessionDebugResponse]: The configured endpoint for a GET request.
         """
-        path = SessionsClient.SESSION_DEBUG_TAB
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_DEBUG_TAB if session_id is None else f"{session_id}/debug/tab"
         return NotteEndpoint(
             path=path,
             response=TabSessionDebugResponse,
@@ -269,43 +270,39 @@ class SessionsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_debug_replay_endpoint(session_id: str | None = None) -> NotteEndpoint[ReplayResponse]:
         """
         Returns an endpoint for retrieving the replay for a session.
         """
-        path = SessionsClient.SESSION_DEBUG_REPLAY
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_DEBUG_REPLAY if session_id is None else f"{session_id}/replay"
         return NotteEndpoint(path=path, response=ReplayResponse, method="GET")
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_debug_offset_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionOffsetResponse]:
         """
         Returns an endpoint for retrieving the offset for a session.
         """
-        path = SessionsClient.SESSION_DEBUG_OFFSET
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_DEBUG_OFFSET if session_id is None else f"{session_id}/offset"
         return NotteEndpoint(path=path, response=SessionOffsetResponse, method="GET")
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_set_cookies_endpoint(session_id: str | None = None) -> NotteEndpoint[SetCookiesResponse]:
         """
         Returns a NotteEndpoint for uploading cookies to a session.
         """
-        path = SessionsClient.SESSION_SET_COOKIES
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_SET_COOKIES if session_id is None else f"{session_id}/cookies"
         return NotteEndpoint(path=path, response=SetCookiesResponse, method="POST")
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _session_get_cookies_endpoint(session_id: str | None = None) -> NotteEndpoint[GetCookiesResponse]:
         """
         Returns a NotteEndpoint for retrieving cookies from a session.
         """
-        path = SessionsClient.SESSION_GET_COOKIES
-        if session_id is not None:
-            path = path.format(session_id=session_id)
+        path = SessionsClient.SESSION_GET_COOKIES if session_id is None else f"{session_id}/cookies"
         return NotteEndpoint(path=path, response=GetCookiesResponse, method="GET")
 
     @track_usage("cloud.session.start")
@@ -420,6 +417,15 @@ class SessionsClient(BaseClient):
         endpoint = SessionsClient._session_list_endpoint(params=params)
         return self.request_list(endpoint)
 
+    async def alist(self, **data: Unpack[SessionListRequestDict]) -> Sequence[SessionResponse]:
+        """
+        Async version of `list`.
+
+        Runs the blocking HTTP call in a worker thread so several list/debug
+        requests can be pipelined with `asyncio.gather`.
+        """
+        return await asyncio.to_thread(lambda: self.list(**data))
+
     @track_usage("cloud.session.debug")
     def debug_info(self, session_id: str) -> SessionDebugResponse:
         """
@@ -456,6 +462,15 @@ class SessionsClient(BaseClient):
         endpoint = SessionsClient._session_debug_tab_endpoint(session_id=session_id, params=params)
         return self.request(endpoint)
 
+    async def adebug_info(self, session_id: str) -> SessionDebugResponse:
+        """
+        Async version of `debug_info`.
+
+        Runs the blocking HTTP call in a worker thread so debug info for
+        multiple sessions can be fetched concurrently with `asyncio.gather`.
+        """
+        return await asyncio.to_thread(self.debug_info, session_id)
+
     @track_usage("cloud.session.offset")
     def offset(self, session_id: str) -> SessionOffsetResponse:
         """
@@ -12,8 +12,6 @@ from notte_sdk.endpoints.personas import NottePersona
 
 import notte
 
-client = NotteClient()
-
 SMTP_SERVER_ENV = "SMTP_SERVER"
 SMTP_PORT_ENV = "SMTP_PORT"
 SMTP_USERNAME_ENV = "EMAIL_SENDER"
@@ -24,9 +22,16 @@ EMAIL_READ_ATTEMPTS = 4
 EMAIL_READ_WAIT_MS = 10_000
 
 
+@pytest.fixture(scope="session")
+def notte_client() -> NotteClient:
+    # constructed lazily so that pytest collection (e.g. --collect-only or a
+    # -k filter that deselects this file) never pays for the client setup
+    return NotteClient()
+
+
 @pytest.fixture
-def persona():
-    return client.Persona("131a21e1-8c8e-4016-80b9-765c0ce4fb5c")
+def persona(notte_client: NotteClient):
+    return notte_client.Persona("131a21e1-8c8e-4016-80b9-765c0ce4fb5c")
 
 
 @pytest.fixture
@@ -102,12 +107,12 @@ def _send_test_email(recipient: str, subject: str) -> str:
 
 
 @pytest.mark.flaky(reruns=3, reruns_delay=5)
-def test_signup_email_extraction():
+def test_signup_email_extraction(notte_client: NotteClient):
     missing_env = [name for name in [SMTP_SERVER_ENV, SMTP_USERNAME_ENV, SMTP_PASSWORD_ENV] if os.getenv(name) is None]
     if missing_env:
         pytest.skip(f"{', '.join(missing_env)} required")
 
-    with client.Persona(create_vault=False, create_phone_number=False) as persona:
+    with notte_client.Persona(create_vault=False, create_phone_number=False) as persona:
         started_at = dt.datetime.now(dt.UTC) - dt.timedelta(seconds=10)
         subject = f"Notte signup persona email delivery {uuid.uuid4()}"
         sender = _send_test_email(persona.info.email, subject)
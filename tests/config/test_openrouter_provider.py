@@ -39,23 +39,23 @@ class TestOpenrouterModelsHaveProvider:
 class TestGetOpenrouterProvider:
     """Tests for LlmModel.get_openrouter_provider() method."""
 
-    def test_cerebras_model_returns_cerebras(self) -> None:
-        assert LlmModel.get_openrouter_provider("cerebras/gpt-oss-120b") == "Cerebras"
-
-    def test_groq_model_returns_groq(self) -> None:
-        assert LlmModel.get_openrouter_provider("groq/gpt-oss-120b") == "Groq"
-
-    def test_together_model_returns_together(self) -> None:
-        assert LlmModel.get_openrouter_provider("together_ai/meta-llama/llama-3.3-70b-instruct") == "Together"
-
-    def test_openai_model_returns_none(self) -> None:
-        assert LlmModel.get_openrouter_provider("openai/gpt-4o") is None
-
-    def test_anthropic_model_returns_none(self) -> None:
-        assert LlmModel.get_openrouter_provider("anthropic/claude-sonnet-4-5-20250929") is None
-
-    def test_gemini_model_returns_none(self) -> None:
-        assert LlmModel.get_openrouter_provider("gemini/gemini-2.5-flash") is None
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("cerebras/gpt-oss-120b", "Cerebras"),
+            ("groq/gpt-oss-120b", "Groq"),
+            ("together_ai/meta-llama/llama-3.3-70b-instruct", "Together"),
+            # already-converted ids keep their pinned provider
+            ("openrouter/groq/gpt-oss-120b", "Groq"),
+            ("openai/gpt-4o", None),
+            ("anthropic/claude-sonnet-4-5-20250929", None),
+            ("gemini/gemini-2.5-flash", None),
+            # provider name appearing inside the model id must not match
+            ("openai/groq-distill-7b", None),
+        ],
+    )
+    def test_get_openrouter_provider(self, model: str, expected: str | None) -> None:
+        assert LlmModel.get_openrouter_provider(model) == expected
 
 
 class TestGetOpenrouterModel:
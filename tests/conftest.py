@@ -2,6 +2,11 @@ import os
 from pathlib import Path
 
 import notte_core
+from dotenv import load_dotenv
+
+# Load .env once for the whole session; conftest is imported before any test
+# module, so per-module/per-test load_dotenv() calls are unnecessary.
+_ = load_dotenv()
 
 CONFIG_PATH = Path(__file__).parent / "test_notte_config.toml"
 notte_core.set_error_mode("developer")
@@ -1,10 +1,21 @@
+import functools
 import logging
+import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+# Each example spawns a browser and makes real LLM calls; only run them when
+# explicitly requested (nightly CI sets NOTTE_RUN_EXAMPLES=1).
+if not os.environ.get("NOTTE_RUN_EXAMPLES"):
+    pytest.skip("set NOTTE_RUN_EXAMPLES=1 to run the example scripts", allow_module_level=True)
 
+_EXAMPLES_DIR = Path(__file__).parent.parent.parent / "examples"
+
+
+@functools.cache
 def find_python_files(directory: Path) -> list[Path]:
     """
     Find all Python files in the given directory, excluding __init__.py and test files.
@@ -33,8 +44,10 @@ def run_python_file(file_path: Path, args: list[str]) -> tuple[int, list[str]]:
     try:
         # Merge stderr into stdout and capture the combined output
         # result = subprocess.run( + args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, check=True)
+        # sys.executable: no PATH lookup and guaranteed to be the same interpreter
+        # (and virtualenv) that runs the test suite
         process = subprocess.Popen(
-            ["python", str(file_path)] + args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+            [sys.executable, str(file_path)] + args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
         )
 
         # Read and log stdout in real-time
@@ -50,6 +63,7 @@ def run_python_file(file_path: Path, args: list[str]) -> tuple[int, list[str]]:
         return -1, logged
 
 
+@functools.cache
 def get_python_files() -> list[Path]:
     """
     Get all Python files in the examples directory.
@@ -57,8 +71,7 @@ def get_python_files() -> list[Path]:
     Returns:
         A list of Path objects for Python files
     """
-    examples_dir = Path(__file__).parent.parent.parent / "examples"
-    return find_python_files(examples_dir)
+    return find_python_files(_EXAMPLES_DIR)
 
 
 def get_use_cases_dirs(
@@ -70,8 +83,7 @@ def get_use_cases_dirs(
     Returns:
         A list of Path objects for example files
     """
-    examples_dir = Path(__file__).parent.parent.parent / "examples"
-    return [dir for dir in examples_dir.glob("*") if dir.is_dir() and dir.name not in ignore_list]
+    return [dir for dir in _EXAMPLES_DIR.glob("*") if dir.is_dir() and dir.name not in ignore_list]
 
 
 @pytest.mark.parametrize("python_file", get_python_files(), ids=lambda p: p.name)
@@ -0,0 +1,8 @@
+import pytest
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Everything under tests/integration drives a real browser and/or the
+    # Notte backend; tag it so local runs can deselect with -m "not integration".
+    for item in items:
+        item.add_marker(pytest.mark.integration)
@@ -0,0 +1,10 @@
+import pytest
+from notte_sdk import NotteClient
+
+
+@pytest.fixture(scope="session")
+def notte_client() -> NotteClient:
+    # One client for the whole file-storage suite: construction performs the
+    # auth handshake, which every parametrized case was paying separately.
+    # FileStorage and Session stay per-test so each case keeps a clean bucket.
+    return NotteClient()
@@ -1,8 +1,6 @@
-import tempfile
 from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
 from notte_browser.errors import NoStorageObjectProvidedError
 from notte_core.actions import DownloadFileAction
 from notte_sdk import NotteClient
@@ -10,7 +8,9 @@ from pydantic import BaseModel, Field
 
 import notte
 
-_ = load_dotenv()
+# Independent browser runs: mark them so fast CI jobs can deselect the group
+# and xdist can spread the parametrized cases across workers.
+pytestmark = [pytest.mark.slow, pytest.mark.network]
 
 DATA_DIR = Path(__file__).parent / "data"
 FIXTURE_HOST = "https://test-resources-lovat.vercel.app"
@@ -85,7 +85,7 @@ fixture_download_cases = [
 
 
 @pytest.mark.parametrize("case", fixture_download_cases, ids=lambda c: c.description)
-def test_download_against_local_fixture(case: FixtureDownloadCase):
+def test_download_against_local_fixture(case: FixtureDownloadCase, notte_client: NotteClient, tmp_path: Path):
     """Agent-less download test against self-hosted fixtures.
 
     Covers three code paths in the download controller:
@@ -97,10 +97,9 @@ def test_download_against_local_fixture(case: FixtureDownloadCase):
     For each case we also download the file back locally and assert the bytes
     match byte-for-byte.
     """
-    notte = NotteClient()
-    storage = notte.FileStorage()
+    storage = notte_client.FileStorage()
 
-    with notte.Session(storage=storage) as session:
+    with notte_client.Session(storage=storage) as session:
         _ = session.execute(type="goto", url=case.url)
         _ = session.execute(type="download_file", selector=case.selector)
 
@@ -112,8 +111,7 @@ def test_download_against_local_fixture(case: FixtureDownloadCase):
         )
         stored_name = matching[0]
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            assert storage.download(file_name=stored_name, local_dir=tmp_dir)
-            local_path = Path(tmp_dir) / stored_name
-            assert local_path.exists(), f"{local_path} missing after storage.download"
-            assert local_path.read_bytes() == case.expected_bytes, f"byte mismatch for {stored_name}"
+        assert storage.download(file_name=stored_name, local_dir=str(tmp_path))
+        local_path = tmp_path / stored_name
+        assert local_path.exists(), f"{local_path} missing after storage.download"
+        assert local_path.read_bytes() == case.expected_bytes, f"byte mismatch for {stored_name}"
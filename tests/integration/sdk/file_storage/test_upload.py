@@ -1,19 +1,19 @@
 from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 from pydantic import BaseModel
 
-_ = load_dotenv()
+# Independent browser runs: mark them so fast CI jobs can deselect the group
+# and xdist can spread the parametrized cases across workers.
+pytestmark = [pytest.mark.slow, pytest.mark.network]
 
 DATA_DIR = Path(__file__).parent / "data"
 UPLOAD_FIXTURE_URL = "https://test-resources-lovat.vercel.app/upload_fixture.html"
 
 
-def test_upload_non_existent_file_should_raise_error():
-    notte = NotteClient()
-    storage = notte.FileStorage()
+def test_upload_non_existent_file_should_raise_error(notte_client: NotteClient):
+    storage = notte_client.FileStorage()
 
     with pytest.raises(FileNotFoundError):
         _ = storage.upload(str(DATA_DIR / "non_existent_file.txt"))
@@ -46,17 +46,16 @@ fixture_upload_cases = [
 
 
 @pytest.mark.parametrize("case", fixture_upload_cases, ids=lambda c: c.file_name)
-def test_upload_against_local_fixture(case: FixtureUploadCase):
+def test_upload_against_local_fixture(case: FixtureUploadCase, notte_client: NotteClient):
     """Agent-less upload test against a self-hosted HTML fixture.
 
     The fixture at UPLOAD_FIXTURE_URL renders the uploaded file's name,
     MIME type, size, and first bytes after the Validate button is clicked,
     so we can assert an upload actually reached the page.
     """
-    notte = NotteClient()
-    storage = notte.FileStorage()
+    storage = notte_client.FileStorage()
 
-    with notte.Session(storage=storage) as session:
+    with notte_client.Session(storage=storage) as session:
         assert storage.upload(str(DATA_DIR / case.file_name))
 
         _ = session.execute(type="goto", url=UPLOAD_FIXTURE_URL)
@@ -1,12 +1,10 @@
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 
 import notte
 
 
 def test_start_stop_agent():
-    _ = load_dotenv()
     notte = NotteClient()
     with notte.Session() as session:
         agent = notte.Agent(session=session, max_steps=10)
@@ -20,7 +18,6 @@ def test_start_stop_agent():
 
 
 def test_agent_ff():
-    _ = load_dotenv()
     notte = NotteClient()
     with notte.Session(browser_type="chrome") as session:
         agent = notte.Agent(session=session, max_steps=3)
@@ -30,7 +27,6 @@ def test_agent_ff():
 @pytest.mark.flaky(reruns=3, reruns_delay=5)
 def test_agent_gemini_form_fill_no_null_fields():
     """Gemini should only fill requested fields, not all fields with null."""
-    _ = load_dotenv()
     client = NotteClient()
     with client.Session() as session:
         agent = client.Agent(session=session, max_steps=3, reasoning_model="vertex_ai/gemini-2.5-flash")
@@ -47,7 +43,6 @@ def test_agent_gemini_form_fill_no_null_fields():
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_local_agent_gemini_form_fill_no_null_fields():
     """Local agent: Gemini should only fill requested fields, not all fields with null."""
-    _ = load_dotenv()
     with notte.Session(headless=True) as session:
         agent = notte.Agent(session=session, max_steps=3, reasoning_model="vertex_ai/gemini-2.5-flash")
         response = agent.run(
@@ -62,7 +57,6 @@ def test_local_agent_gemini_form_fill_no_null_fields():
 
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_start_agent_with_gemini_reasoning():
-    _ = load_dotenv()
     notte = NotteClient()
     with notte.Session() as session:
         agent = notte.Agent(session=session, reasoning_model="gemini/gemini-2.5-flash", max_steps=3)
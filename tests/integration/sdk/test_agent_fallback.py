@@ -1,10 +1,7 @@
 import pytest
-from dotenv import load_dotenv
 from notte_core.common.config import LlmModel
 from notte_sdk.client import NotteClient
 
-_ = load_dotenv()
-
 
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_agent_fallback():
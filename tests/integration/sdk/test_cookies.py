@@ -1,47 +1,51 @@
 import json
-import tempfile
 from pathlib import Path
 
-from dotenv import load_dotenv
 from notte_core.common.config import CookieDict
 from notte_sdk import NotteClient
-from pytest import fixture
+from pytest import TempPathFactory, fixture
+
+COOKIES: list[CookieDict] = [
+    CookieDict(
+        {
+            "name": "sb-db-auth-token",
+            "value": "base64-XFV",
+            "domain": "console.notte.cc",
+            "path": "/",
+            "expires": 1904382506.913704,
+            "httpOnly": False,
+            "secure": False,
+            "sameSite": "Lax",
+        }
+    )
+]
+
+# The payload is deterministic, so it is serialized once at import instead of
+# per test.
+_COOKIES_JSON = json.dumps(COOKIES)
+
+
+@fixture(scope="session")
+def cookies() -> list[CookieDict]:
+    return COOKIES
 
 
-@fixture
-def cookies() -> list[CookieDict]:
-    return [
-        CookieDict(
-            {
-                "name": "sb-db-auth-token",
-                "value": "base64-XFV",
-                "domain": "console.notte.cc",
-                "path": "/",
-                "expires": 1904382506.913704,
-                "httpOnly": False,
-                "secure": False,
-                "sameSite": "Lax",
-            }
-        )
-    ]
-
-
-def test_set_cookies(cookies: list[CookieDict]):
-    _ = load_dotenv()
-    notte = NotteClient()
+@fixture(scope="session")
+def cookie_file(tmp_path_factory: TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("cookies") / "cookies.json"
+    _ = Path(path).write_text(_COOKIES_JSON)
+    return str(path)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        cookie_path = Path(temp_dir) / "cookies.json"
-        with open(cookie_path, "w") as f:
-            json.dump(cookies, f)
 
-        # create a new session
-        with notte.Session(timeout_minutes=1) as session:
-            _ = session.set_cookies(cookie_file=str(cookie_path))
+def test_set_cookies(cookie_file: str):
+    notte = NotteClient()
+
+    # create a new session
+    with notte.Session(timeout_minutes=1) as session:
+        _ = session.set_cookies(cookie_file=cookie_file)
 
 
 def test_get_cookies():
-    _ = load_dotenv()
     notte = NotteClient()
 
     # create a new session
@@ -53,24 +57,18 @@ def test_get_cookies():
     assert len(resp) > 0
 
 
-def test_get_set_cookies(cookies: list[CookieDict]):
-    _ = load_dotenv()
+def test_get_set_cookies(cookies: list[CookieDict], cookie_file: str):
     notte = NotteClient()
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        cookie_path = Path(temp_dir) / "cookies.json"
-        with open(cookie_path, "w") as f:
-            json.dump(cookies, f)
-
-        # create a new session
-        with notte.Session(timeout_minutes=1) as session:
-            _ = session.set_cookies(cookie_file=str(cookie_path))
+    # create a new session
+    with notte.Session(timeout_minutes=1) as session:
+        _ = session.set_cookies(cookie_file=cookie_file)
 
-            resp = session.get_cookies()
+        resp = session.get_cookies()
 
-        assert any(
-            cookie["name"] == cookies[0]["name"]
-            and cookie["domain"] == cookies[0]["domain"]
-            and cookie["value"] == cookies[0]["value"]
-            for cookie in resp
-        )
+    assert any(
+        cookie["name"] == cookies[0]["name"]
+        and cookie["domain"] == cookies[0]["domain"]
+        and cookie["value"] == cookies[0]["value"]
+        for cookie in resp
+    )
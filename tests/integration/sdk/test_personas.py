@@ -1,7 +1,6 @@
 import os
 
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 from notte_sdk.errors import NotteAPIError
 
@@ -34,7 +33,6 @@ def test_persona_id() -> str:
 
 
 def test_persona_in_local_agent():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     with client.Persona(create_vault=True) as persona:
@@ -44,7 +42,6 @@ def test_persona_in_local_agent():
 
 
 def test_persona_should_be_deleted_after_exit_context():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     persona_id = None
     with client.Persona() as persona:
@@ -55,7 +52,6 @@ def test_persona_should_be_deleted_after_exit_context():
 
 
 def test_persona_with_vault_in_remote_agent():
-    _ = load_dotenv()
 
     client = NotteClient()
     # Create a new persona with vault
@@ -81,7 +77,6 @@ def test_persona_with_vault_in_remote_agent():
 
 @pytest.mark.skip(reason="This test should not be run as it costs money")
 def test_persona_phone_number_management(test_persona_id: str):
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     persona = client.Persona(persona_id=test_persona_id)
 
@@ -96,7 +91,6 @@ def test_persona_phone_number_management(test_persona_id: str):
 
 @pytest.mark.skip(reason="This test should not be run as it costs money")
 def test_persona_with_phone_number_creation():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with pytest.raises(NotteAPIError, match="No more phone numbers available"):
         with client.Persona(create_phone_number=True) as persona:
@@ -118,7 +112,6 @@ def test_persona_with_phone_number_creation():
 
 
 def test_persona_with_vault_creation():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     with client.Persona(create_vault=True) as persona:
@@ -146,7 +139,6 @@ def test_persona_with_vault_creation():
 
 
 def test_persona_email_reading_with_filters(test_persona_id: str):
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     persona = client.Persona(persona_id=test_persona_id)
@@ -164,7 +156,6 @@ def test_persona_email_reading_with_filters(test_persona_id: str):
 
 
 def test_persona_sms_reading_with_filters(test_persona_id: str):
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     persona = client.Persona(persona_id=test_persona_id)
@@ -182,7 +173,6 @@ def test_persona_sms_reading_with_filters(test_persona_id: str):
 
 
 def test_persona_get_operations():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     persona_id = None
     try:
@@ -204,7 +194,6 @@ def test_persona_get_operations():
 
 
 def test_persona_delete_operations():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     # Create persona
@@ -229,7 +218,6 @@ def test_persona_delete_operations():
 
 
 def test_persona_without_vault_access():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     with client.Persona() as persona:
@@ -243,7 +231,6 @@ def test_persona_without_vault_access():
 
 
 def test_persona_context_manager():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     persona_id = None
@@ -262,7 +249,6 @@ def test_persona_context_manager():
 
 
 def test_persona_with_existing_id():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     # Create persona first
@@ -284,7 +270,6 @@ def test_persona_with_existing_id():
 
 
 def test_persona_error_handling():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     # Try to get non-existent persona
@@ -314,7 +299,6 @@ def test_persona_error_handling():
 
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_persona_form_filling():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
     with client.Persona(create_vault=False, create_phone_number=False) as persona:
@@ -2,14 +2,12 @@ import os
 import time
 
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 from notte_sdk.errors import NotteAPIError
 
 
 @pytest.fixture
 def client() -> NotteClient:
-    _ = load_dotenv()
     return NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
 
 
@@ -2,7 +2,6 @@ import os
 from typing import Any
 
 import pytest
-from dotenv import load_dotenv
 from notte_browser.session import NotteSession
 from notte_sdk.client import NotteClient
 from notte_sdk.types import ScrapeRequest
@@ -46,7 +45,6 @@ def pricing_plans_json():
 
 
 def test_scraping_markdown():
-    _ = load_dotenv()
     with NotteSession() as session:
         result = session.execute(type="goto", url="https://www.notte.cc/pricing")
         assert result.success
@@ -57,7 +55,6 @@ def test_scraping_markdown():
 
 @pytest.mark.asyncio
 async def test_scraping_response_format():
-    _ = load_dotenv()
     async with NotteSession() as session:
         result = session.execute(type="goto", url="https://www.notte.cc/pricing")
         assert result.success
@@ -75,7 +72,6 @@ async def test_scraping_response_format():
 
 @pytest.mark.asyncio
 async def test_scraping_custom_instructions():
-    _ = load_dotenv()
     async with NotteSession() as session:
         result = session.execute(type="goto", url="https://www.notte.cc/pricing")
         assert result.success
@@ -90,7 +86,6 @@ async def test_scraping_custom_instructions():
 
 @pytest.mark.asyncio
 async def test_scraping_custom_instructions_and_response_format():
-    _ = load_dotenv()
     async with NotteSession() as session:
         result = session.execute(type="goto", url="https://www.notte.cc/pricing")
         assert result.success
@@ -103,7 +98,6 @@ async def test_scraping_custom_instructions_and_response_format():
 
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_sdk_scraping_markdown():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     data = client.scrape(url="https://www.notte.cc")
     assert isinstance(data, str)
@@ -111,7 +105,6 @@ def test_sdk_scraping_markdown():
 
 
 def test_sdk_scraping_markdown_no_positional():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     data = client.scrape("https://www.notte.cc")
     assert isinstance(data, str)
@@ -119,7 +112,6 @@ def test_sdk_scraping_markdown_no_positional():
 
 
 def test_sdk_scraping_response_format():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     plans = client.scrape(url="https://www.notte.cc/pricing", response_format=PricingPlans, raise_on_failure=True)
     assert isinstance(plans, PricingPlans)
@@ -128,7 +120,6 @@ def test_sdk_scraping_response_format():
 
 @pytest.mark.flaky(reruns=2, reruns_delay=5)
 def test_sdk_scraping_response_format_json(pricing_plans_json: dict[str, Any]):
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     request = ScrapeRequest.model_validate(dict(response_format=pricing_plans_json))
     assert request.response_format is not None
@@ -139,7 +130,6 @@ def test_sdk_scraping_response_format_json(pricing_plans_json: dict[str, Any]):
 
 @pytest.mark.asyncio
 async def test_readme_async_scraping_example():
-    _ = load_dotenv()
     async with NotteSession() as session:
         result = session.execute(type="goto", url="https://www.notte.cc/pricing")
         assert result.success
@@ -149,7 +139,6 @@ async def test_readme_async_scraping_example():
 
 
 def test_readme_sync_scraping_example():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with client.Session() as session:
         result = session.execute({"type": "goto", "url": "https://www.notte.cc"})
@@ -161,7 +150,6 @@ def test_readme_sync_scraping_example():
 
 @pytest.mark.asyncio
 async def test_scraping_images_only():
-    _ = load_dotenv()
     async with NotteSession() as session:
         result = session.execute(type="goto", url="https://gymbeam.pl")
         assert result.success
@@ -171,7 +159,6 @@ async def test_scraping_images_only():
 
 @pytest.mark.asyncio
 async def test_scraping_structured_data():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with client.Session() as session:
         _ = session.execute(type="goto", url="https://gymbeam.pl")
@@ -195,7 +182,6 @@ class SiteUpdate(BaseModel):
 
 
 def test_scraping_structured_data_with_response_format_and_raise_on_failure_false():
-    _ = load_dotenv()
     notte = NotteClient()
     with notte.Session(browser_type="chrome", viewport_height=1080, viewport_width=1920) as page:
         n_articles = 10
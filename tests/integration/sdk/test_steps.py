@@ -1,11 +1,8 @@
 import time
 
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 
-_ = load_dotenv()
-
 
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_new_steps():
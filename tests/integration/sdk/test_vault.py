@@ -3,7 +3,6 @@ from pathlib import Path
 from unittest import TestCase
 
 import pytest
-from dotenv import load_dotenv
 from notte_agent.falco.agent import FalcoAgent
 from notte_core.actions import FillAction, FormFillAction, WaitAction
 from notte_core.credentials import PASSWORD as PASSWORD_PLACEHOLDER
@@ -32,7 +31,6 @@ async def load_github_signin_fixture(session: notte.Session) -> None:
 
 
 def test_vault_in_local_agent():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     vault = client.Vault()
     _ = vault.add_credentials(
@@ -49,7 +47,6 @@ def test_vault_in_local_agent():
 
 @pytest.mark.asyncio
 async def test_vault_replace_form_fill():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with client.Vault() as vault, notte.Session() as session:
         EMAIL = "xyz@notte.cc"
@@ -86,7 +83,6 @@ async def test_vault_replace_form_fill():
 
 @pytest.mark.asyncio
 async def test_vault_replace_fill():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with client.Vault() as vault, notte.Session() as session:
         EMAIL = "xyz@notte.cc"
@@ -125,7 +121,6 @@ async def test_vault_replace_fill():
 
 
 def test_vault_should_be_deleted_after_exit_context():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     vault_id = None
     with client.Vault() as vault:
@@ -136,7 +131,6 @@ def test_vault_should_be_deleted_after_exit_context():
 
 
 def test_vault_in_remote_agent():
-    _ = load_dotenv()
 
     client = NotteClient()
     # Create a new secure vault
@@ -154,7 +148,6 @@ def test_vault_in_remote_agent():
 
 
 def test_add_credentials_from_env():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     peeple_dict = dict(email="xyz@notte.cc", password="xyz")
     os.environ["PEEPLE_COM_EMAIL"] = peeple_dict["email"]
@@ -193,7 +186,6 @@ def test_all_credentials_in_system_prompt():
 
 
 def test_add_wrong_otp():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with client.Vault() as vault:
         with pytest.raises(ValueError):
@@ -206,7 +198,6 @@ def test_add_wrong_otp():
 
 
 def test_add_correct_otp():
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     with client.Vault() as vault:
         _ = vault.add_credentials(
@@ -235,7 +226,6 @@ def test_invalid_credentials_in_local_agent():
 @pytest.mark.asyncio
 async def test_session_form_fill_with_vault_without_observe_uses_live_url():
     """Test form_fill credential replacement snapshots the live page before vault lookup."""
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     base_url = "https://apartment-board-demo-nine.vercel.app"
     login_url = f"{base_url}/auth/signin"
@@ -297,7 +287,6 @@ async def test_session_form_fill_with_vault_without_observe_uses_live_url():
 @pytest.mark.asyncio
 async def test_session_set_vault_enables_credential_replacement():
     """Test that session.set_vault() enables credential replacement via _action_with_vault."""
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     EMAIL = "test@notte.cc"
     PASSWORD = "testpass123"  # pragma: allowlist secret
@@ -328,7 +317,6 @@ async def test_session_set_vault_enables_credential_replacement():
 @pytest.mark.asyncio
 async def test_session_vault_in_constructor():
     """Test that passing vault to session constructor enables credential replacement."""
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     EMAIL = "constructor@notte.cc"
     PASSWORD = "constructorpass"  # pragma: allowlist secret
@@ -351,7 +339,6 @@ async def test_session_vault_in_constructor():
 @pytest.mark.asyncio
 async def test_session_fill_action_with_vault():
     """Test that FillAction credentials are replaced via session vault."""
-    _ = load_dotenv()
     client = NotteClient(api_key=os.getenv("NOTTE_API_KEY"))
     EMAIL = "fill@notte.cc"
     URL = "https://github.com/"
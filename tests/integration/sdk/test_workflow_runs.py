@@ -5,7 +5,6 @@ from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 from notte_sdk.endpoints.functions import NotteFunction
 from notte_sdk.endpoints.workflows import RemoteWorkflow
@@ -18,8 +17,6 @@ from notte_sdk.types import (
     UpdateFunctionRunResponse,
 )
 
-_ = load_dotenv()
-
 
 @pytest.fixture(scope="module")
 def client():
@@ -218,7 +215,10 @@ class TestFunctionRunExecution:
     """Test cases for actual workflow run execution."""
 
     @patch("requests.post")
-    def test_run_workflow_cloud_execution(self, mock_post, client: NotteClient, test_workflow: GetFunctionResponse):
+    @patch("notte_sdk.endpoints.base._http_session.post")
+    def test_run_workflow_cloud_execution(
+        self, mock_session_post, mock_post, client: NotteClient, test_workflow: GetFunctionResponse
+    ):
         """Test running a workflow in cloud mode."""
         # Mock the create_run response
         create_run_mock_response = type(
@@ -253,8 +253,10 @@ class TestFunctionRunExecution:
             },
         )()
 
-        # Configure mock to return different responses for different calls
-        mock_post.side_effect = [create_run_mock_response, run_workflow_mock_response]
+        # create_run goes through the client's persistent session, the (streaming)
+        # run call uses module-level requests.post
+        mock_session_post.return_value = create_run_mock_response
+        mock_post.return_value = run_workflow_mock_response
 
         # Create a run first
         create_response = client.functions.create_run(function_id=test_workflow.workflow_id)
@@ -275,15 +277,14 @@ class TestFunctionRunExecution:
         assert response.status == "closed"
 
         # Verify both requests were made correctly
-        assert mock_post.call_count == 2
+        assert mock_session_post.call_count == 1
+        assert mock_post.call_count == 1
 
         # Check the first call (create_run)
-        first_call_args = mock_post.call_args_list[0]
-        assert "data" in first_call_args.kwargs
+        assert "data" in mock_session_post.call_args.kwargs
 
         # Check the second call (run workflow)
-        second_call_args = mock_post.call_args_list[1]
-        assert "data" in second_call_args.kwargs
+        assert "data" in mock_post.call_args.kwargs
 
     def test_run_workflow_invalid_run_id(self, client: NotteClient, test_workflow: GetFunctionResponse):
         """Test running a workflow with invalid run ID."""
@@ -3,7 +3,6 @@ import tempfile
 from collections.abc import Generator
 
 import pytest
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 from notte_sdk.endpoints.functions import NotteFunction
 from notte_sdk.endpoints.workflows import RemoteWorkflow
@@ -18,7 +17,6 @@ from notte_sdk.types import (
 @pytest.fixture(scope="module")
 def client():
     """Create a NotteClient instance for testing."""
-    _ = load_dotenv()
     return NotteClient()
 
 
@@ -33,7 +33,6 @@ def urls() -> list[str]:
 
 
 @pytest.mark.flaky(reruns=2, reruns_delay=5)
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "url",
     urls(),
@@ -9,7 +9,6 @@ import os
 
 import notte_core.common.config as notte_config
 import pytest
-from dotenv import load_dotenv
 
 import notte
 
@@ -44,15 +43,11 @@ def to_openrouter_model(model: str) -> str:
 def check_openrouter_available() -> bool:
     """Check if OpenRouter API key is available.
 
-    Note: Relies on load_dotenv() having been called at module import time.
+    Note: Relies on the .env load performed by tests/conftest.py at import time.
     """
     return os.getenv("OPENROUTER_API_KEY") is not None
 
 
-# Load .env at module import time (before pytest collection evaluates skipif)
-load_dotenv()
-
-
 @pytest.fixture(autouse=True, scope="module")
 def enable_openrouter_for_module():
     """Enable OpenRouter mode for this test module with proper teardown."""
@@ -1,7 +1,6 @@
 import os
 
 import pytest
-from dotenv import load_dotenv
 from notte_core.common.config import LlmModel, enable_openrouter
 from notte_llm.engine import LLMEngine
 from pydantic import BaseModel
@@ -13,7 +12,6 @@ class Country(BaseModel):
 
 
 def get_models() -> list[LlmModel]:
-    _ = load_dotenv()
     if enable_openrouter():
         # enable all models
         return list(LlmModel)
@@ -4,7 +4,6 @@ import os
 from typing import Any
 
 import pytest
-from dotenv import load_dotenv
 from notte_browser.scraping.pruning import MarkdownPruningPipe
 from notte_browser.scraping.schema import SchemaScrapingPipe
 from notte_core.common.config import LlmModel
@@ -13,8 +12,6 @@ from notte_llm.service import LLMService
 from pydantic import BaseModel, RootModel
 from typing_extensions import override
 
-_ = load_dotenv()
-
 
 class MockLLMServiceForSchema(LLMService):
     """Mock LLM service that returns structured data with placeholders."""
@@ -14,7 +14,9 @@ echo "Summary will be saved to: $SUMMARY_FILE"
 echo "-----------------------------------"
 
 # Run the test command and save full output
-uv run pytest tests/examples --durations 10 | tee "$FULL_LOG"
+# -n auto: examples are independent scripts, run them in parallel across workers
+# NOTTE_RUN_EXAMPLES: the example tests are skipped unless explicitly requested
+NOTTE_RUN_EXAMPLES=1 uv run pytest tests/examples --durations 10 -n auto | tee "$FULL_LOG"
 status=$?
 
 # Now extract the summary portion
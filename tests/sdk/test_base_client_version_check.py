@@ -317,8 +317,12 @@ class TestBaseClientVersionCheck:
 
                     client = BaseClient(MockNotteClient(), None, api_key=api_key)
 
-                with pytest.raises(RuntimeError) as exc_info:
-                    client.request(mock_endpoint)
+                # The endpoint GET goes through the shared _http_session, not
+                # requests.get; return the same payload to trigger the
+                # validation error without hitting the network.
+                with patch("notte_sdk.endpoints.base._http_session.get", return_value=mock_pypi_response):
+                    with pytest.raises(RuntimeError) as exc_info:
+                        client.request(mock_endpoint)
 
                 # Check that the error message contains upgrade suggestion
                 error_message = str(exc_info.value)
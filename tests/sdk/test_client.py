@@ -88,7 +88,7 @@ def session_response_dict(session_id: str, close: bool = False) -> dict[str, Any
 
 def test_open_viewer_true_spawns_viewer(client: NotteClient, session_id: str) -> None:
     """Test that open_viewer=True spawns the viewer."""
-    with patch("requests.post") as mock_post:
+    with patch("notte_sdk.endpoints.base._http_session.post") as mock_post:
         mock_response = session_response_dict(session_id)
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = mock_response
@@ -102,7 +102,7 @@ def test_open_viewer_true_spawns_viewer(client: NotteClient, session_id: str) ->
 
 def test_open_viewer_false_no_viewer(client: NotteClient, session_id: str) -> None:
     """Test that open_viewer=False does not spawn the viewer."""
-    with patch("requests.post") as mock_post:
+    with patch("notte_sdk.endpoints.base._http_session.post") as mock_post:
         mock_response = session_response_dict(session_id)
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = mock_response
@@ -116,7 +116,7 @@ def test_open_viewer_false_no_viewer(client: NotteClient, session_id: str) -> No
 
 def test_session_always_headless_true_on_wire(client: NotteClient, session_id: str, headers: dict[str, str]) -> None:
     """Test that session start requests always include headless=True."""
-    with patch("requests.post") as mock_post:
+    with patch("notte_sdk.endpoints.base._http_session.post") as mock_post:
         mock_response = session_response_dict(session_id)
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = mock_response
@@ -161,7 +161,7 @@ def _stop_session(mock_delete: MagicMock, client: NotteClient, session_id: str)
     return client.sessions.stop(session_id)
 
 
-@patch("requests.post")
+@patch("notte_sdk.endpoints.base._http_session.post")
 @pytest.mark.order(1)
 def test_start_session(mock_post: MagicMock, client: NotteClient, session_id: str, headers: dict[str, str]) -> None:
     session_data: SessionStartRequestDict = {
@@ -190,7 +190,7 @@ def test_start_session(mock_post: MagicMock, client: NotteClient, session_id: st
     )
 
 
-@patch("requests.delete")
+@patch("notte_sdk.endpoints.base._http_session.delete")
 @pytest.mark.order(2)
 def test_close_session(mock_delete: MagicMock, client: NotteClient, session_id: str, headers: dict[str, str]) -> None:
     response = _stop_session(mock_delete=mock_delete, client=client, session_id=session_id)
@@ -206,7 +206,7 @@ def test_close_session(mock_delete: MagicMock, client: NotteClient, session_id:
     )
 
 
-@patch("requests.post")
+@patch("notte_sdk.endpoints.base._http_session.post")
 def test_scrape(mock_post: MagicMock, client: NotteClient, session_id: str, headers: dict[str, str]) -> None:
     mock_response = {
         "markdown": "test space",
@@ -225,8 +225,8 @@ def test_scrape(mock_post: MagicMock, client: NotteClient, session_id: str, head
 
 
 @pytest.mark.parametrize("start_session", [True, False])
-@patch("requests.delete")
-@patch("requests.post")
+@patch("notte_sdk.endpoints.base._http_session.delete")
+@patch("notte_sdk.endpoints.base._http_session.post")
 def test_observe(
     mock_post: MagicMock,
     mock_delete: MagicMock,
@@ -287,8 +287,8 @@ def test_observe(
 
 
 @pytest.mark.parametrize("start_session", [True, False])
-@patch("requests.delete")
-@patch("requests.post")
+@patch("notte_sdk.endpoints.base._http_session.delete")
+@patch("notte_sdk.endpoints.base._http_session.post")
 def test_step(
     mock_post: MagicMock,
     mock_delete: MagicMock,
@@ -445,7 +445,7 @@ def test_managed_auth_ids_are_serialized_and_must_be_unique() -> None:
         SessionStartRequest(auth_ids=[auth_ids[0], auth_ids[0]])
 
 
-@patch("requests.post")
+@patch("notte_sdk.endpoints.base._http_session.post")
 def test_managed_auth_connection_check(mock_post: MagicMock, client: NotteClient, headers: dict[str, str]) -> None:
     auth_id = "55555555-5555-5555-5555-555555555555"
     mock_post.return_value.status_code = 200
@@ -527,7 +527,7 @@ def test_session_start_with_new_timeout_params(client: NotteClient, session_id:
     """Test session start with new timeout parameters."""
     max_duration_minutes = 10
     idle_timeout_minutes = 5
-    with patch("requests.post") as mock_post:
+    with patch("notte_sdk.endpoints.base._http_session.post") as mock_post:
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {
             "session_id": session_id,
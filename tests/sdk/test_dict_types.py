@@ -2,7 +2,6 @@ import os
 from typing import ClassVar, get_args, get_origin, get_type_hints
 
 import pytest
-from dotenv import load_dotenv
 from notte_core.common.config import CookieDict, LlmModel, NotteConfig, NotteConfigDict
 from notte_sdk.types import (
     DEFAULT_MAX_NB_STEPS,
@@ -110,16 +109,16 @@ def _test_request_dict_alignment(base_request: type[BaseModel], base_request_dic
         request_type = field_type
         dict_type = dict_fields[field_name]
 
-        # Handle Optional types
-        if hasattr(request_type, "__origin__") and hasattr(request_type, "__args__"):
-            request_type_args = get_args(request_type)
-            if type(None) in request_type_args:
-                request_type = next(t for t in request_type_args if t is not type(None))
+        # Handle Optional types: unwrap both the Optional[X] and X | None
+        # spellings so the comparison does not depend on which one the
+        # interpreter resolved the annotation to
+        request_type_args = get_args(request_type)
+        if type(None) in request_type_args:
+            request_type = next(t for t in request_type_args if t is not type(None))
 
-        if hasattr(dict_type, "__origin__") and hasattr(dict_type, "__args__"):
-            dict_type_args = get_args(dict_type)
-            if type(None) in dict_type_args:
-                dict_type = next(t for t in dict_type_args if t is not type(None))
+        dict_type_args = get_args(dict_type)
+        if type(None) in dict_type_args:
+            dict_type = next(t for t in dict_type_args if t is not type(None))
 
         # Compare the types
         if field_name not in ("selector", "profile", "proxies"):
@@ -290,7 +289,6 @@ def test_agent_create_request_with_invalid_model(model: str):
 
 
 def test_agent_create_request_with_valid_model():
-    _ = load_dotenv()
     if os.getenv("OPENAI_API_KEY") is None:
         with pytest.raises(ValueError):
             _ = AgentCreateRequest(reasoning_model="openai/gpt-4o")
@@ -1,9 +1,7 @@
-from dotenv import load_dotenv
 from notte_sdk import NotteClient
 
 
 def test_simple_listing():
-    _ = load_dotenv()
     notte = NotteClient()
 
     # Default listing